@@ -10,9 +10,13 @@ from tkinter import ttk
 from typing import Optional, Callable, Dict, Any
 import datetime as dt
 import json
+import logging
+import os
 import platform
 import subprocess
 
+logger = logging.getLogger(__name__)
+
 class ThemeMode:
     LIGHT = "light"
     DARK = "dark"
@@ -66,7 +70,7 @@ class AdaptiveThemeManager:
             with open(self.config_file, 'w') as f:
                 json.dump(self.config, f, indent=2)
         except Exception as e:
-            print(f"Failed to save theme config: {e}")
+            logger.warning("Failed to save theme config: %s", e)
     
     def get_system_theme(self) -> Optional[str]:
         """Detect system theme preference"""
@@ -97,11 +101,10 @@ class AdaptiveThemeManager:
                     
             elif system == "linux":
                 # Check GTK theme or environment variables
-                import os
-                gtk_theme = os.environ.get('GTK_THEME', '')
-                if 'dark' in gtk_theme.lower():
+                gtk_theme = os.environ.get('GTK_THEME', '').lower()
+                if 'dark' in gtk_theme:
                     return ThemeMode.DARK
-                elif 'light' in gtk_theme.lower():
+                elif 'light' in gtk_theme:
                     return ThemeMode.LIGHT
                     
         except Exception:
@@ -8,13 +8,23 @@ Creates convincing user profiles, activities, water intake, and weather data.
 import random
 import datetime as dt
 from typing import List, Dict, Any, Optional
-from faker import Faker
 from .db import (
     upsert_user, upsert_activity, add_water_intake, 
     insert_weather, get_user, daily_water_total
 )
 
-fake = Faker()
+# Faker is slow to import and only needed once demo data is generated,
+# so it is loaded on first use rather than when the GUI imports this module
+_fake = None
+
+
+def _get_fake():
+    global _fake
+    if _fake is None:
+        from faker import Faker
+        _fake = Faker()
+    return _fake
+
 
 class DemoDataGenerator:
     """
@@ -22,6 +32,25 @@ class DemoDataGenerator:
     for NovaFit Plus health tracking application.
     """
     
+    # Daily step range per activity level
+    BASE_STEPS = {
+        "sedentary": (2000, 5000),
+        "light": (4000, 8000),
+        "moderate": (6000, 12000),
+        "active": (8000, 15000),
+        "very_active": (10000, 20000)
+    }
+    ACTIVITY_LEVELS = tuple(BASE_STEPS)
+    
+    # Seasonal base temperature (°C) per month
+    MONTHLY_BASE_TEMP = {
+        1: 5, 2: 8, 3: 12, 4: 16, 5: 21, 6: 26,
+        7: 29, 8: 28, 9: 24, 10: 18, 11: 12, 12: 7
+    }
+    
+    # Temperature adjustment (°C) per demo location country
+    COUNTRY_TEMP_OFFSET = {"Spain": 5, "UK": -3, "Japan": 2}
+    
     def __init__(self, db_path: str):
         self.db_path = db_path
         self.demo_users = []
@@ -33,10 +62,10 @@ class DemoDataGenerator:
             {"city": "London", "country": "UK", "lat": 51.5074, "lon": -0.1278},
             {"city": "Tokyo", "country": "Japan", "lat": 35.6762, "lon": 139.6503},
         ]
-        self.weather_conditions = [
+        self.weather_conditions = (
             "Sunny", "Partly Cloudy", "Cloudy", "Light Rain", 
             "Rain", "Thunderstorm", "Snow", "Foggy", "Windy"
-        ]
+        )
     
     def generate_realistic_user(self) -> Dict[str, Any]:
         """Generate a realistic user profile with coherent data"""
@@ -58,12 +87,12 @@ class DemoDataGenerator:
         location = random.choice(self.weather_locations)
         
         user_data = {
-            "name": fake.name(),
+            "name": _get_fake().name(),
             "age": age,
             "sex": sex,
             "height": round(height, 1),
             "weight": round(weight, 1),
-            "activity_level": random.choice(["sedentary", "light", "moderate", "active", "very_active"]),
+            "activity_level": random.choice(self.ACTIVITY_LEVELS),
             "city": location["city"],
             "country": location["country"]
         }
@@ -72,16 +101,8 @@ class DemoDataGenerator:
     
     def generate_realistic_activity(self, user_data: Dict, date: dt.date) -> Dict[str, Any]:
         """Generate realistic daily activity based on user profile and consistency"""
-        base_steps = {
-            "sedentary": (2000, 5000),
-            "light": (4000, 8000),
-            "moderate": (6000, 12000),
-            "active": (8000, 15000),
-            "very_active": (10000, 20000)
-        }
-        
         activity_level = user_data["activity_level"]
-        min_steps, max_steps = base_steps.get(activity_level, (5000, 10000))
+        min_steps, max_steps = self.BASE_STEPS.get(activity_level, (5000, 10000))
         
         # Add weekly patterns (less active on weekends for some people)
         if date.weekday() >= 5 and random.random() < 0.3:  # Weekend
@@ -211,19 +232,10 @@ class DemoDataGenerator:
     def generate_weather_data(self, location: Dict, date: dt.date) -> Dict[str, Any]:
         """Generate realistic weather data for a location and date"""
         # Seasonal temperature patterns
-        month = date.month
-        base_temp = {
-            1: 5, 2: 8, 3: 12, 4: 16, 5: 21, 6: 26,
-            7: 29, 8: 28, 9: 24, 10: 18, 11: 12, 12: 7
-        }.get(month, 15)
+        base_temp = self.MONTHLY_BASE_TEMP.get(date.month, 15)
         
         # Add location-based adjustments
-        if "Spain" in location["country"]:
-            base_temp += 5
-        elif "UK" in location["country"]:
-            base_temp -= 3
-        elif "Japan" in location["country"]:
-            base_temp += 2
+        base_temp += self.COUNTRY_TEMP_OFFSET.get(location["country"], 0)
         
         temp_max = base_temp + random.randint(-5, 8)
         temp_min = temp_max - random.randint(3, 12)
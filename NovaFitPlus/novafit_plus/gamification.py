@@ -8,11 +8,18 @@ Motivates users through game mechanics while promoting healthy habits.
 import tkinter as tk
 from tkinter import ttk
 from typing import Dict, List, Optional, Callable
+import contextlib
 import datetime as dt
 import json
-from dataclasses import dataclass, asdict
+import logging
+import math
+import os
+from dataclasses import dataclass, fields
+from operator import attrgetter
 from enum import Enum
 
+logger = logging.getLogger(__name__)
+
 class GoalType(Enum):
     HYDRATION = "hydration"
     STEPS = "steps"
@@ -72,20 +79,51 @@ class UserProfile:
     goals_completed: int = 0
     last_activity_date: Optional[str] = None
 
+# Field names resolved once; save_data builds flat dicts from these instead of
+# asdict(), which recursively deep-copies every value
+_GOAL_FIELDS = tuple(f.name for f in fields(Goal))
+_ACHIEVEMENT_FIELDS = tuple(f.name for f in fields(Achievement))
+_PROFILE_FIELDS = tuple(f.name for f in fields(UserProfile))
+_get_goal_fields = attrgetter(*_GOAL_FIELDS)
+_get_achievement_fields = attrgetter(*_ACHIEVEMENT_FIELDS)
+_get_profile_fields = attrgetter(*_PROFILE_FIELDS)
+
 class GamificationEngine:
     """Main gamification engine"""
     
+    # (activity_data key, minimum value, achievement id), checked in order
+    ACHIEVEMENT_RULES = (
+        ('daily_water_ml', 2000, 'hydro_novice'),
+        ('daily_steps', 10000, 'walker'),
+        ('sleep_hours', 8, 'well_rested'),
+        ('health_score', 70, 'healthy_start'),
+        ('health_score', 90, 'health_guru'),
+    )
+    
+    # (minimum current streak in days, achievement id)
+    STREAK_RULES = (
+        (7, 'consistent'),
+        (30, 'unstoppable'),
+    )
+    
     def __init__(self, db_path: str, user_name: str):
         self.db_path = db_path
         self.user_name = user_name
         self.goals: Dict[str, Goal] = {}
         self.achievements: Dict[str, Achievement] = {}
         self.user_profile = UserProfile()
+        # (data_file, data) of the last successful write
+        self._last_saved: Optional[tuple] = None
         
         # Load gamification data
         self.load_data()
         self.setup_default_achievements()
         
+    @property
+    def data_file(self) -> str:
+        """Per-user save file; follows user_name when the active user changes"""
+        return f"gamification_{self.user_name}.json"
+    
     def setup_default_achievements(self):
         """Setup default achievements if not already loaded"""
         default_achievements = [
@@ -188,37 +226,11 @@ class GamificationEngine:
         """Check for newly unlocked achievements"""
         newly_unlocked = []
         
-        # Check hydration achievements
-        daily_water = activity_data.get('daily_water_ml', 0)
-        if daily_water >= 2000:
-            achievement = self.unlock_achievement('hydro_novice')
-            if achievement:
-                newly_unlocked.append(achievement)
-        
-        # Check steps achievements
-        daily_steps = activity_data.get('daily_steps', 0)
-        if daily_steps >= 10000:
-            achievement = self.unlock_achievement('walker')
-            if achievement:
-                newly_unlocked.append(achievement)
-        
-        # Check sleep achievements
-        sleep_hours = activity_data.get('sleep_hours', 0)
-        if sleep_hours >= 8:
-            achievement = self.unlock_achievement('well_rested')
-            if achievement:
-                newly_unlocked.append(achievement)
-        
-        # Check health score achievements
-        health_score = activity_data.get('health_score', 0)
-        if health_score >= 70:
-            achievement = self.unlock_achievement('healthy_start')
-            if achievement:
-                newly_unlocked.append(achievement)
-        if health_score >= 90:
-            achievement = self.unlock_achievement('health_guru')
-            if achievement:
-                newly_unlocked.append(achievement)
+        for metric, threshold, achievement_id in self.ACHIEVEMENT_RULES:
+            if activity_data.get(metric, 0) >= threshold:
+                achievement = self.unlock_achievement(achievement_id)
+                if achievement:
+                    newly_unlocked.append(achievement)
         
         # Update streak-based achievements
         self.update_streaks(activity_data)
@@ -270,15 +282,13 @@ class GamificationEngine:
                 self.user_profile.longest_streak = self.user_profile.current_streak
             
             # Check streak achievements
-            if self.user_profile.current_streak >= 7:
-                self.unlock_achievement('consistent')
-            if self.user_profile.current_streak >= 30:
-                self.unlock_achievement('unstoppable')
+            for threshold, achievement_id in self.STREAK_RULES:
+                if self.user_profile.current_streak >= threshold:
+                    self.unlock_achievement(achievement_id)
     
     def update_level(self):
         """Update user level based on points"""
         # Simple level formula: level = sqrt(points / 100) + 1
-        import math
         new_level = int(math.sqrt(self.user_profile.total_points / 100)) + 1
         
         if new_level > self.user_profile.level:
@@ -288,7 +298,6 @@ class GamificationEngine:
     
     def get_level_progress(self) -> tuple:
         """Get current level progress (current_points, points_for_next_level)"""
-        import math
         current_level = self.user_profile.level
         points_for_current = (current_level - 1) ** 2 * 100
         points_for_next = current_level ** 2 * 100
@@ -351,23 +360,40 @@ class GamificationEngine:
     def save_data(self):
         """Save gamification data to file"""
         data = {
-            'user_profile': asdict(self.user_profile),
-            'goals': {k: asdict(v) for k, v in self.goals.items()},
-            'achievements': {k: asdict(v) for k, v in self.achievements.items()}
+            'user_profile': dict(zip(_PROFILE_FIELDS, _get_profile_fields(self.user_profile))),
+            'goals': {
+                k: dict(zip(_GOAL_FIELDS, _get_goal_fields(v)))
+                for k, v in self.goals.items()
+            },
+            'achievements': {
+                k: dict(zip(_ACHIEVEMENT_FIELDS, _get_achievement_fields(v)))
+                for k, v in self.achievements.items()
+            }
         }
+        if (self.data_file, data) == self._last_saved:
+            # Nothing changed since the last write to this same file (e.g.
+            # complete_goal followed by update_goal_progress) - skip rewriting
+            return
         
-        filename = f"gamification_{self.user_name}.json"
+        tmp_filename = self.data_file + ".tmp"
         try:
-            with open(filename, 'w') as f:
-                json.dump(data, f, indent=2, default=self._enum_serializer)
+            # Write to a temp file and swap it in so a crash never leaves a
+            # truncated save behind (load_data would silently start fresh)
+            with open(tmp_filename, 'w') as f:
+                json.dump(data, f, separators=(',', ':'), default=self._enum_serializer)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_filename, self.data_file)
+            self._last_saved = (self.data_file, data)
         except Exception as e:
-            print(f"Failed to save gamification data: {e}")
+            logger.warning("Failed to save gamification data: %s", e)
+            with contextlib.suppress(OSError):
+                os.remove(tmp_filename)
     
     def load_data(self):
         """Load gamification data from file"""
-        filename = f"gamification_{self.user_name}.json"
         try:
-            with open(filename, 'r') as f:
+            with open(self.data_file, 'r') as f:
                 data = json.load(f)
             
             # Load user profile
@@ -9,9 +9,23 @@ import tkinter as tk
 from tkinter import ttk
 from typing import Dict, List, Optional, Callable, Tuple
 import json
+import logging
 from dataclasses import dataclass, asdict
 from abc import ABC, abstractmethod
 
+# Weather module for emoji functions, resolved once at import time
+try:
+    from . import weather as wz
+except ImportError:
+    import sys
+    sys.path.append('.')
+    try:
+        import weather as wz
+    except ImportError:
+        wz = None
+
+logger = logging.getLogger(__name__)
+
 @dataclass
 class WidgetConfig:
     """Configuration for dashboard widgets"""
@@ -175,42 +189,55 @@ class ChartWidget(DashboardWidget):
         )
         self.canvas.pack(pady=5)
         
+        # Canvas items are created once and updated in place on refresh
+        canvas_width = self.canvas.winfo_reqwidth()
+        canvas_height = self.canvas.winfo_reqheight()
+        self._empty_text = self.canvas.create_text(
+            canvas_width // 2,
+            canvas_height // 2,
+            text="No data",
+            fill="gray",
+            state="hidden"
+        )
+        self._line = self.canvas.create_line(
+            0, 0, 0, 0,
+            fill="#3b82f6",
+            width=2,
+            smooth=True,
+            state="hidden"
+        )
+        
         self.make_draggable()
     
     def update_content(self, data: dict):
         """Update chart widget with new data"""
-        self.canvas.delete("all")
         values = data.get('values', [])
         
         if not values:
-            self.canvas.create_text(
-                self.canvas.winfo_reqwidth() // 2,
-                self.canvas.winfo_reqheight() // 2,
-                text="No data",
-                fill="gray"
-            )
+            self.canvas.itemconfig(self._line, state="hidden")
+            self.canvas.itemconfig(self._empty_text, state="normal")
             return
         
-        # Draw simple line chart
-        canvas_width = self.canvas.winfo_reqwidth()
-        canvas_height = self.canvas.winfo_reqheight()
+        self.canvas.itemconfig(self._empty_text, state="hidden")
         
+        # Draw simple line chart
         if len(values) > 1:
-            max_val = max(values) if max(values) > 0 else 1
-            points = []
+            canvas_width = self.canvas.winfo_reqwidth()
+            canvas_height = self.canvas.winfo_reqheight()
+            max_val = max(values)
+            if max_val <= 0:
+                max_val = 1
+            x_step = canvas_width / (len(values) - 1)
+            y_scale = canvas_height * 0.8 / max_val
             
+            points = []
             for i, val in enumerate(values):
-                x = i * (canvas_width / (len(values) - 1))
-                y = canvas_height - (val / max_val * canvas_height * 0.8)
-                points.extend([x, y])
+                points.extend([i * x_step, canvas_height - val * y_scale])
             
-            if len(points) >= 4:
-                self.canvas.create_line(
-                    points,
-                    fill="#3b82f6",
-                    width=2,
-                    smooth=True
-                )
+            self.canvas.coords(self._line, points)
+            self.canvas.itemconfig(self._line, state="normal")
+        else:
+            self.canvas.itemconfig(self._line, state="hidden")
 
 class ProgressWidget(DashboardWidget):
     """Widget for displaying progress bars and goals"""
@@ -382,17 +409,6 @@ class WeatherWidget(DashboardWidget):
     
     def update_content(self, data: dict):
         """Update weather widget with new data"""
-        # Import weather module for emoji functions
-        try:
-            from . import weather as wz
-        except:
-            import sys
-            sys.path.append('.')
-            try:
-                import weather as wz
-            except:
-                wz = None
-        
         condition_code = data.get('condition_code', 0)
         temp_max = data.get('temp_max', '--')
         temp_min = data.get('temp_min', '--')
@@ -400,15 +416,9 @@ class WeatherWidget(DashboardWidget):
         wind = data.get('wind', '--')
         city = data.get('city', '--')
         
-        # Update emoji and condition
-        if wz and hasattr(wz, 'code_to_emoji'):
-            try:
-                emoji = wz.code_to_emoji(condition_code)
-                self.condition_label.config(text=emoji)
-            except Exception:
-                self.condition_label.config(text="🌡️")
-        else:
-            self.condition_label.config(text="🌡️")
+        # Update emoji and condition (code_to_emoji falls back to 🌡️ for unknown codes)
+        emoji = wz.code_to_emoji(condition_code) if wz else "🌡️"
+        self.condition_label.config(text=emoji)
         
         # Update temperature
         if temp_max != '--' and temp_min != '--':
@@ -421,6 +431,36 @@ class WeatherWidget(DashboardWidget):
         self.wind_label.config(text=f"💨 {wind} km/h" if wind != '--' else "💨 -- km/h")
         self.city_label.config(text=f"📍 {city}" if city != '--' else "📍 --")
 
+def _snapshot(value):
+    """Copy the containers of a widget payload, keeping leaves (callables, Tk objects) by reference"""
+    if isinstance(value, dict):
+        return {k: _snapshot(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_snapshot(v) for v in value]
+    if isinstance(value, tuple):
+        return tuple(_snapshot(v) for v in value)
+    return value
+
+# widget_type -> widget class, used by ModularDashboard.create_widget
+_WIDGET_CLASSES = {
+    'stats': StatsWidget,
+    'chart': ChartWidget,
+    'progress': ProgressWidget,
+    'actions': QuickActionWidget,
+    'weather': WeatherWidget
+}
+
+# (widget_type, label) choices offered by the "Add Widget" dialog
+_WIDGET_TYPE_LABELS = (
+    ("stats", "Statistics"),
+    ("chart", "Chart"),
+    ("progress", "Progress"),
+    ("actions", "Quick Actions"),
+    ("weather", "Weather")
+)
+
+_LAYOUT_PRESETS = ("Default", "Analytics Focus", "Goals Focus", "Minimal")
+
 class ModularDashboard:
     """Main modular dashboard manager"""
     
@@ -429,6 +469,7 @@ class ModularDashboard:
         self.config_file = config_file
         self.widgets: Dict[str, DashboardWidget] = {}
         self.widget_configs: Dict[str, WidgetConfig] = {}
+        self._last_data: Dict[str, dict] = {}  # what each widget currently shows
         
         # Create main dashboard frame
         self.dashboard_frame = ttk.Frame(parent, style='Dashboard.TFrame')
@@ -479,7 +520,7 @@ class ModularDashboard:
         
         preset_combo = ttk.Combobox(
             self.control_frame,
-            values=["Default", "Analytics Focus", "Goals Focus", "Minimal"],
+            values=_LAYOUT_PRESETS,
             state="readonly",
             width=15
         )
@@ -500,15 +541,7 @@ class ModularDashboard:
         types_frame = ttk.Frame(dialog)
         types_frame.pack(pady=5)
         
-        widget_types = [
-            ("stats", "Statistics"),
-            ("chart", "Chart"),
-            ("progress", "Progress"),
-            ("actions", "Quick Actions"),
-            ("weather", "Weather")
-        ]
-        
-        for value, text in widget_types:
+        for value, text in _WIDGET_TYPE_LABELS:
             ttk.Radiobutton(
                 types_frame,
                 text=text,
@@ -556,19 +589,12 @@ class ModularDashboard:
     
     def create_widget(self, config: WidgetConfig):
         """Create a new dashboard widget"""
-        widget_classes = {
-            'stats': StatsWidget,
-            'chart': ChartWidget,
-            'progress': ProgressWidget,
-            'actions': QuickActionWidget,
-            'weather': WeatherWidget
-        }
-        
-        widget_class = widget_classes.get(config.widget_type, StatsWidget)
+        widget_class = _WIDGET_CLASSES.get(config.widget_type, StatsWidget)
         widget = widget_class(self.dashboard_frame, config)
         
         self.widgets[config.id] = widget
         self.widget_configs[config.id] = config
+        self._last_data.pop(config.id, None)
         
         # Add context menu for widget management
         self.add_widget_context_menu(widget)
@@ -577,16 +603,18 @@ class ModularDashboard:
     
     def add_widget_context_menu(self, widget: DashboardWidget):
         """Add right-click context menu to widget"""
+        # Built once per widget; each right-click only posts it
+        context_menu = tk.Menu(widget.frame, tearoff=0)
+        context_menu.add_command(
+            label="Configure",
+            command=lambda: self.configure_widget(widget.config.id)
+        )
+        context_menu.add_command(
+            label="Remove",
+            command=lambda: self.remove_widget(widget.config.id)
+        )
+        
         def show_context_menu(event):
-            context_menu = tk.Menu(self.parent, tearoff=0)
-            context_menu.add_command(
-                label="Configure",
-                command=lambda: self.configure_widget(widget.config.id)
-            )
-            context_menu.add_command(
-                label="Remove",
-                command=lambda: self.remove_widget(widget.config.id)
-            )
             context_menu.tk_popup(event.x_root, event.y_root)
         
         widget.frame.bind("<Button-3>", show_context_menu)
@@ -602,6 +630,7 @@ class ModularDashboard:
             self.widgets[widget_id].frame.destroy()
             del self.widgets[widget_id]
             del self.widget_configs[widget_id]
+            self._last_data.pop(widget_id, None)
     
     def load_layout(self):
         """Load dashboard layout from file"""
@@ -640,7 +669,7 @@ class ModularDashboard:
             with open(self.config_file, 'w') as f:
                 json.dump(data, f, indent=2)
         except Exception as e:
-            print(f"Failed to save layout: {e}")
+            logger.warning("Failed to save layout: %s", e)
     
     def reset_layout(self):
         """Reset dashboard to default layout"""
@@ -650,6 +679,7 @@ class ModularDashboard:
         
         self.widgets.clear()
         self.widget_configs.clear()
+        self._last_data.clear()
         
         # Create default layout
         self.create_default_layout()
@@ -663,7 +693,12 @@ class ModularDashboard:
         """Update all widgets with new data"""
         for widget_id, widget in self.widgets.items():
             if widget_id in data:
-                widget.update_content(data[widget_id])
+                widget_data = data[widget_id]
+                # Widgets are static between refreshes; only redraw what changed
+                if self._last_data.get(widget_id) == widget_data:
+                    continue
+                widget.update_content(widget_data)
+                self._last_data[widget_id] = _snapshot(widget_data)
 
 
 def setup_dashboard_styles(style: ttk.Style):
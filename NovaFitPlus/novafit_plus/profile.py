@@ -1,9 +1,13 @@
+from bisect import bisect_right
 from typing import Tuple
 
+_BMI_THRESHOLDS = (18.5, 25, 30)
+_BMI_CATEGORIES = ("Underweight", "Normal", "Overweight", "Obese")
+
 def bmi(weight_kg: float, height_cm: float) -> Tuple[float, str]:
     h_m = max(0.5, height_cm / 100.0)
     val = weight_kg / (h_m * h_m)
-    cat = "Underweight" if val < 18.5 else "Normal" if val < 25 else "Overweight" if val < 30 else "Obese"
+    cat = _BMI_CATEGORIES[bisect_right(_BMI_THRESHOLDS, val)]
     return round(val, 2), cat
 
 def bmr_mifflin(age: int, sex: str, height_cm: float, weight_kg: float) -> float:
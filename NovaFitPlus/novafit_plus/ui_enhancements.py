@@ -17,9 +17,39 @@ import tkinter as tk
 from tkinter import ttk
 import datetime as _dt
 from typing import Optional, Callable, Dict, Any, List, Tuple
+import logging
 import threading
 import time
-import math
+from bisect import bisect_left, bisect_right
+from types import MappingProxyType
+
+
+logger = logging.getLogger(__name__)
+
+# Shared colour/icon tables, built once instead of per toast or status update.
+# Read-only because every toast exposes _TOAST_COLORS as self.colors.
+_TOAST_COLORS = MappingProxyType({
+    "info": MappingProxyType({"bg": "#e3f2fd", "fg": "#1976d2", "border": "#2196f3"}),
+    "success": MappingProxyType({"bg": "#e8f5e8", "fg": "#2e7d32", "border": "#4caf50"}),
+    "warning": MappingProxyType({"bg": "#fff3e0", "fg": "#f57c00", "border": "#ff9800"}),
+    "error": MappingProxyType({"bg": "#ffebee", "fg": "#d32f2f", "border": "#f44336"})
+})
+
+_TOAST_ICONS = MappingProxyType({"info": "ℹ️", "success": "✅", "warning": "⚠️", "error": "❌"})
+
+_PANEL_COLORS = MappingProxyType({
+    "info": MappingProxyType({"bg": "#eff6ff", "border": "#3b82f6", "fg": "#1e40af"}),
+    "success": MappingProxyType({"bg": "#f0fdf4", "border": "#10b981", "fg": "#065f46"}),
+    "warning": MappingProxyType({"bg": "#fffbeb", "border": "#f59e0b", "fg": "#92400e"}),
+    "error": MappingProxyType({"bg": "#fef2f2", "border": "#ef4444", "fg": "#991b1b"})
+})
+
+_STATUS_COLORS = MappingProxyType({
+    "success": "#10b981",
+    "warning": "#f59e0b",
+    "error": "#ef4444",
+    "info": "#3b82f6"
+})
 
 
 class ToolTip:
@@ -30,11 +60,16 @@ class ToolTip:
         ToolTip(widget, "This is a helpful tooltip message")
     """
     
+    # One instance per hinted widget; no per-instance __dict__ needed
+    __slots__ = ('widget', 'text', 'delay', 'tooltip', '_label', '_visible', 'timer')
+    
     def __init__(self, widget: tk.Widget, text: str, delay: int = 500):
         self.widget = widget
         self.text = text
         self.delay = delay
         self.tooltip = None
+        self._label = None
+        self._visible = False
         self.timer = None
         
         # Bind events
@@ -55,17 +90,29 @@ class ToolTip:
     
     def show_tooltip(self):
         """Display the tooltip"""
-        if self.tooltip:
+        self.timer = None
+        if self._visible:
             return
             
         # Get widget position
         x = self.widget.winfo_rootx() + 20
         y = self.widget.winfo_rooty() + self.widget.winfo_height() + 5
         
-        # Create tooltip window
+        # The tooltip window is built once and then shown/hidden on demand
+        if self.tooltip is None:
+            self._build_tooltip()
+        else:
+            self._label.configure(text=self.text)
+        
+        self.tooltip.wm_geometry(f"+{x}+{y}")
+        self.tooltip.deiconify()
+        self._visible = True
+    
+    def _build_tooltip(self):
+        """Create the (initially hidden) tooltip window"""
         self.tooltip = tk.Toplevel(self.widget)
+        self.tooltip.withdraw()
         self.tooltip.wm_overrideredirect(True)
-        self.tooltip.wm_geometry(f"+{x}+{y}")
         
         # Style the tooltip
         frame = tk.Frame(
@@ -78,7 +125,7 @@ class ToolTip:
         )
         frame.pack()
         
-        label = tk.Label(
+        self._label = tk.Label(
             frame,
             text=self.text,
             background="#fffbf0",
@@ -87,13 +134,13 @@ class ToolTip:
             wraplength=300,
             justify="left"
         )
-        label.pack()
+        self._label.pack()
     
     def hide_tooltip(self):
         """Hide the tooltip"""
-        if self.tooltip:
-            self.tooltip.destroy()
-            self.tooltip = None
+        if self._visible:
+            self.tooltip.withdraw()
+            self._visible = False
 
 
 class NotificationToast:
@@ -110,12 +157,7 @@ class NotificationToast:
         self.toast = None
         
         # Color schemes for different notification types
-        self.colors = {
-            "info": {"bg": "#e3f2fd", "fg": "#1976d2", "border": "#2196f3"},
-            "success": {"bg": "#e8f5e8", "fg": "#2e7d32", "border": "#4caf50"},
-            "warning": {"bg": "#fff3e0", "fg": "#f57c00", "border": "#ff9800"},
-            "error": {"bg": "#ffebee", "fg": "#d32f2f", "border": "#f44336"}
-        }
+        self.colors = _TOAST_COLORS
         
         self.create_toast(message, toast_type)
     
@@ -153,19 +195,12 @@ class NotificationToast:
         main_frame.pack(fill="both", expand=True, padx=2, pady=2)
         
         # Add icon based on type
-        icons = {
-            "info": "ℹ️",
-            "success": "✅",
-            "warning": "⚠️",
-            "error": "❌"
-        }
-        
         icon_frame = tk.Frame(main_frame, bg=colors["bg"])
         icon_frame.pack(side="left", padx=(10, 5), pady=10)
         
         tk.Label(
             icon_frame,
-            text=icons.get(toast_type, "ℹ️"),
+            text=_TOAST_ICONS.get(toast_type, "ℹ️"),
             bg=colors["bg"],
             font=("TkDefaultFont", 14)
         ).pack()
@@ -453,6 +488,7 @@ class KeyboardShortcuts:
     def __init__(self, root: tk.Tk):
         self.root = root
         self.shortcuts = {}
+        self._help_text: Optional[str] = None  # rebuilt when shortcuts change
         self.setup_default_shortcuts()
     
     def setup_default_shortcuts(self):
@@ -466,18 +502,32 @@ class KeyboardShortcuts:
             'callback': callback,
             'description': description
         }
+        self._help_text = None
         self.root.bind(f"<{key_combination}>", lambda e: callback())
     
+    def _build_help_text(self) -> str:
+        """Format the shortcuts list shown in the help dialog"""
+        lines = ["Available Keyboard Shortcuts:\n\n", "F1                    Show this help\n"]
+        
+        for key, info in self.shortcuts.items():
+            if info['description']:
+                # Format key combination for display
+                display_key = key.replace("Control", "Ctrl").replace("-", "+")
+                lines.append(f"{display_key:<20} {info['description']}\n")
+        
+        if not self.shortcuts:
+            lines.append("\nNo additional shortcuts configured.")
+        
+        return "".join(lines)
+    
     def show_help(self):
         """Show keyboard shortcuts help dialog"""
         help_window = tk.Toplevel(self.root)
         help_window.title("Keyboard Shortcuts")
-        help_window.geometry("400x300")
         help_window.transient(self.root)
         help_window.grab_set()
         
-        # Center the window
-        help_window.update_idletasks()
+        # Center the window; the size is fixed, so no layout pass is needed to measure it
         x = (help_window.winfo_screenwidth() // 2) - (400 // 2)
         y = (help_window.winfo_screenheight() // 2) - (300 // 2)
         help_window.geometry(f"400x300+{x}+{y}")
@@ -513,19 +563,9 @@ class KeyboardShortcuts:
         scrollbar.pack(side="right", fill="y")
         
         # Add shortcuts to text
-        shortcuts_text = "Available Keyboard Shortcuts:\n\n"
-        shortcuts_text += "F1                    Show this help\n"
-        
-        for key, info in self.shortcuts.items():
-            if info['description']:
-                # Format key combination for display
-                display_key = key.replace("Control", "Ctrl").replace("-", "+")
-                shortcuts_text += f"{display_key:<20} {info['description']}\n"
-        
-        if not self.shortcuts:
-            shortcuts_text += "\nNo additional shortcuts configured."
-        
-        text_widget.insert("1.0", shortcuts_text)
+        if self._help_text is None:
+            self._help_text = self._build_help_text()
+        text_widget.insert("1.0", self._help_text)
         text_widget.configure(state="disabled")
         
         # Close button
@@ -555,6 +595,7 @@ class AutoRefreshManager:
         self.callbacks: Dict[str, Dict[str, Any]] = {}
         self.is_running = False
         self.is_paused = False
+        self.is_hidden = False  # root unmapped (e.g. minimized)
         self.thread = None
         self.last_user_activity = time.time()
         self.activity_threshold = 300  # 5 minutes of inactivity before slowing refresh
@@ -567,13 +608,23 @@ class AutoRefreshManager:
         def on_activity(event=None):
             self.last_user_activity = time.time()
         
-        # Bind to common activity events
-        self.root.bind_all("<Button-1>", on_activity)
-        self.root.bind_all("<Key>", on_activity)
-        self.root.bind_all("<Motion>", on_activity)
+        # Bind to common activity events; add="+" chains onto any existing
+        # application-wide bindings instead of replacing them
+        self.root.bind_all("<Button-1>", on_activity, add="+")
+        self.root.bind_all("<Key>", on_activity, add="+")
+        self.root.bind_all("<Motion>", on_activity, add="+")
+        
+        # Track visibility so pure-redraw callbacks can sit out while hidden
+        def on_map_change(event=None):
+            if event.widget is self.root:
+                self.is_hidden = event.type == tk.EventType.Unmap
+        
+        self.root.bind("<Map>", on_map_change, add="+")
+        self.root.bind("<Unmap>", on_map_change, add="+")
     
     def add_callback(self, name: str, callback: Callable, interval: int = 60, 
-                    priority: str = "normal", condition: Optional[Callable] = None):
+                    priority: str = "normal", condition: Optional[Callable] = None,
+                    skip_when_hidden: bool = False):
         """
         Add a callback to the refresh system
         
@@ -583,12 +634,15 @@ class AutoRefreshManager:
             interval: Refresh interval in seconds
             priority: 'high', 'normal', or 'low' - affects refresh frequency during inactivity
             condition: Optional function that returns True if refresh should happen
+            skip_when_hidden: Skip while the window is minimized; only for callbacks
+                that purely redraw widgets (no notifications or other side effects)
         """
         self.callbacks[name] = {
             'callback': callback,
             'interval': interval,
             'priority': priority,
             'condition': condition,
+            'skip_when_hidden': skip_when_hidden,
             'last_run': 0,
             'error_count': 0
         }
@@ -631,6 +685,10 @@ class AutoRefreshManager:
                     is_user_inactive = inactive_time > self.activity_threshold
                     
                     for name, info in self.callbacks.items():
+                        # Nothing to redraw while the window is not shown
+                        if self.is_hidden and info['skip_when_hidden']:
+                            continue
+                        
                         # Skip if condition function returns False
                         if info['condition'] and not info['condition']():
                             continue
@@ -658,13 +716,13 @@ class AutoRefreshManager:
                                 info['error_count'] += 1
                                 # Stop calling if too many errors
                                 if info['error_count'] > 5:
-                                    print(f"Auto-refresh: Disabling {name} due to repeated errors: {e}")
+                                    logger.warning("Auto-refresh: Disabling %s due to repeated errors: %s", name, e)
                                     del self.callbacks[name]
                                     break
                 
                 time.sleep(1)  # Check every second
             except Exception as e:
-                print(f"Auto-refresh error: {e}")
+                logger.warning("Auto-refresh error: %s", e)
                 time.sleep(5)  # Wait longer on error
     
     def get_status(self) -> Dict[str, Any]:
@@ -673,6 +731,7 @@ class AutoRefreshManager:
         return {
             'running': self.is_running,
             'paused': self.is_paused,
+            'hidden': self.is_hidden,
             'callbacks_count': len(self.callbacks),
             'user_inactive': inactive_time > self.activity_threshold,
             'inactive_time': inactive_time
@@ -696,6 +755,7 @@ class TrendCard(ttk.Frame):
         self.icon = icon
         self.color = color
         self.trend_data: List[float] = []
+        self._shown_texts: Optional[tuple] = None
         
         self.setup_ui()
     
@@ -711,6 +771,7 @@ class TrendCard(ttk.Frame):
         # Accent strip
         self.accent_canvas = tk.Canvas(main_frame, width=4, highlightthickness=0, bd=0)
         self.accent_canvas.grid(row=0, column=0, sticky="ns", padx=(0, 12))
+        self._accent_rect = self.accent_canvas.create_rectangle(0, 0, 4, 100, state="hidden")
         
         # Content area
         content_frame = ttk.Frame(main_frame, style='Card.TFrame')
@@ -766,18 +827,21 @@ class TrendCard(ttk.Frame):
     def update_data(self, trend_data: List[float], current_value: str, 
                    trend_text: str = "", subtitle: str = ""):
         """Update the card with new data"""
-        self.trend_data = trend_data[-10:]  # Keep last 10 points
-        
-        # Update text elements
-        self.value_label.configure(text=current_value)
-        self.trend_label.configure(text=trend_text)
-        self.subtitle_label.configure(text=subtitle)
-        
-        # Update sparkline
-        self.draw_sparkline()
-        
-        # Update accent strip
-        self.update_accent_color()
+        trend_data = list(trend_data[-10:])  # Keep last 10 points
+        texts = (current_value, trend_text, subtitle)
+        
+        # Update text elements only when they changed
+        if texts != self._shown_texts:
+            self._shown_texts = texts
+            self.value_label.configure(text=current_value)
+            self.trend_label.configure(text=trend_text)
+            self.subtitle_label.configure(text=subtitle)
+        
+        # Sparkline and accent strip depend only on the trend data
+        if trend_data != self.trend_data:
+            self.trend_data = trend_data
+            self.draw_sparkline()
+            self.update_accent_color()
     
     def draw_sparkline(self):
         """Draw a sparkline chart showing trend"""
@@ -800,27 +864,33 @@ class TrendCard(ttk.Frame):
         max_val = max(self.trend_data)
         val_range = max_val - min_val if max_val != min_val else 1
         
+        # Per-point constants, hoisted out of the loops below
+        color = self.color
+        x_step = chart_width / (len(self.trend_data) - 1)
+        y_scale = chart_height / val_range
+        y_base = padding + chart_height
+        create_oval = canvas.create_oval
+        
         # Create points for line
         points = []
         for i, value in enumerate(self.trend_data):
-            x = padding + (i / (len(self.trend_data) - 1)) * chart_width
-            y = padding + chart_height - ((value - min_val) / val_range) * chart_height
-            points.extend([x, y])
+            points.append(padding + i * x_step)
+            points.append(y_base - (value - min_val) * y_scale)
         
         # Draw line
         if len(points) >= 4:
-            canvas.create_line(points, fill=self.color, width=2, smooth=True)
+            canvas.create_line(points, fill=color, width=2, smooth=True)
         
         # Draw points
         for i in range(0, len(points), 2):
             x, y = points[i], points[i + 1]
-            canvas.create_oval(x-1, y-1, x+1, y+1, fill=self.color, outline=self.color)
+            create_oval(x-1, y-1, x+1, y+1, fill=color, outline=color)
         
         # Highlight last point
         if len(points) >= 2:
             last_x, last_y = points[-2], points[-1]
-            canvas.create_oval(last_x-2, last_y-2, last_x+2, last_y+2, 
-                             fill=self.color, outline="white", width=1)
+            create_oval(last_x-2, last_y-2, last_x+2, last_y+2, 
+                        fill=color, outline="white", width=1)
     
     def update_accent_color(self):
         """Update accent strip color based on trend"""
@@ -837,9 +907,8 @@ class TrendCard(ttk.Frame):
         else:
             color = self.color  # Default color for no change
         
-        # Update accent strip
-        self.accent_canvas.delete("all")
-        self.accent_canvas.create_rectangle(0, 0, 4, 100, fill=color, outline=color)
+        # Update accent strip in place
+        self.accent_canvas.itemconfig(self._accent_rect, fill=color, outline=color, state="normal")
 
 
 class SmartNotificationCenter:
@@ -855,6 +924,7 @@ class SmartNotificationCenter:
     def __init__(self, root: tk.Widget):
         self.root = root
         self.notification_history: List[Dict] = []
+        self._sent_markers: set = set()  # (notification_type, date) pairs
         self.user_preferences = {
             'hydration_reminders': True,
             'achievement_celebrations': True,
@@ -954,18 +1024,15 @@ class SmartNotificationCenter:
     
     def _notification_sent_today(self, notification_type: str) -> bool:
         """Check if a notification type was already sent today"""
-        today = _dt.date.today()
-        return any(
-            n.get('type') == notification_type and 
-            n.get('timestamp', _dt.datetime.min).date() == today
-            for n in self.notification_history
-        )
+        return (notification_type, _dt.date.today()) in self._sent_markers
     
     def _mark_notification_sent(self, notification_type: str):
         """Mark a notification type as sent for today"""
+        now = _dt.datetime.now()
+        self._sent_markers.add((notification_type, now.date()))
         self.notification_history.append({
             'type': notification_type,
-            'timestamp': _dt.datetime.now(),
+            'timestamp': now,
             'shown': True
         })
 
@@ -976,6 +1043,13 @@ class SmartNotificationToast(NotificationToast):
     Extends the basic NotificationToast with interactive capabilities.
     """
     
+    # Button label for each known action id
+    ACTION_LABELS = {
+        'add_water': 'Add Water',
+        'view_insights': 'View Insights',
+        'log_activity': 'Log Activity'
+    }
+    
     def __init__(self, parent: tk.Widget, title: str, message: str, 
                  toast_type: str = "info", action: Optional[str] = None, duration: int = 3000):
         self.title = title
@@ -987,12 +1061,7 @@ class SmartNotificationToast(NotificationToast):
         self.toast = None
         
         # Color schemes for different notification types
-        self.colors = {
-            "info": {"bg": "#e3f2fd", "fg": "#1976d2", "border": "#2196f3"},
-            "success": {"bg": "#e8f5e8", "fg": "#2e7d32", "border": "#4caf50"},
-            "warning": {"bg": "#fff3e0", "fg": "#f57c00", "border": "#ff9800"},
-            "error": {"bg": "#ffebee", "fg": "#d32f2f", "border": "#f44336"}
-        }
+        self.colors = _TOAST_COLORS
         
         self.create_smart_toast(title, message, toast_type)
     
@@ -1033,10 +1102,9 @@ class SmartNotificationToast(NotificationToast):
         header_frame.pack(fill="x", padx=12, pady=(8, 4))
         
         # Icon
-        icons = {"info": "ℹ️", "success": "✅", "warning": "⚠️", "error": "❌"}
         tk.Label(
             header_frame,
-            text=icons.get(toast_type, "ℹ️"),
+            text=_TOAST_ICONS.get(toast_type, "ℹ️"),
             bg=colors["bg"],
             font=("TkDefaultFont", 12)
         ).pack(side="left")
@@ -1083,11 +1151,7 @@ class SmartNotificationToast(NotificationToast):
             action_frame = tk.Frame(main_frame, bg=colors["bg"])
             action_frame.pack(fill="x", padx=12, pady=(0, 8))
             
-            action_text = {
-                'add_water': 'Add Water',
-                'view_insights': 'View Insights',
-                'log_activity': 'Log Activity'
-            }.get(self.action, 'Take Action')
+            action_text = self.ACTION_LABELS.get(self.action, 'Take Action')
             
             tk.Button(
                 action_frame,
@@ -1114,7 +1178,7 @@ class SmartNotificationToast(NotificationToast):
         """Handle action button clicks"""
         # This would integrate with the main application's functions
         # For now, just close the notification
-        print(f"Action triggered: {self.action}")
+        logger.debug("Action triggered: %s", self.action)
         self.destroy()
 
 
@@ -1154,7 +1218,10 @@ class BreadcrumbNavigation(ttk.Frame):
     
     def update_path(self, path_elements: List[str]):
         """Update the breadcrumb path"""
-        self.path_elements = path_elements
+        # The labels already show this path; rebuilding them would only churn widgets
+        if list(path_elements) == self.path_elements and self.content_frame.winfo_children():
+            return
+        self.path_elements = list(path_elements)
         self.refresh_display()
     
     def refresh_display(self):
@@ -1234,6 +1301,7 @@ class ProgressRing(tk.Canvas):
         self.thickness = thickness
         self.progress = 0
         self.color = "#3b82f6"
+        self._shown = (0, "0%")  # (percentage, text) currently on the canvas
         
         super().__init__(
             parent,
@@ -1281,7 +1349,7 @@ class ProgressRing(tk.Canvas):
     
     def set_progress(self, percentage: float, text: str = "", color: str = None, animate: bool = True):
         """Update the progress ring"""
-        if color:
+        if color and color != self.color:
             self.color = color
             self.itemconfig(self.progress_arc, outline=color)
         
@@ -1312,6 +1380,10 @@ class ProgressRing(tk.Canvas):
     
     def _update_progress(self, percentage: float, text: str):
         """Update the visual progress"""
+        if (percentage, text) == self._shown:
+            return
+        self._shown = (percentage, text)
+        
         # Calculate arc extent (negative for clockwise)
         extent = -(percentage / 100) * 360
         
@@ -1351,6 +1423,7 @@ class StatusBar(ttk.Frame):
             bd=0
         )
         self.status_indicator.pack(side="left", padx=(0, 4))
+        self._status_dot = self.status_indicator.create_oval(2, 2, 10, 10, width=1)
         
         self.status_label = ttk.Label(
             self.status_frame,
@@ -1388,18 +1461,10 @@ class StatusBar(ttk.Frame):
     
     def update_status(self, message: str, status_type: str = "info"):
         """Update the status indicator and message"""
-        colors = {
-            "success": "#10b981",
-            "warning": "#f59e0b", 
-            "error": "#ef4444",
-            "info": "#3b82f6"
-        }
-        
-        color = colors.get(status_type, colors["info"])
+        color = _STATUS_COLORS.get(status_type, _STATUS_COLORS["info"])
         
-        # Update indicator
-        self.status_indicator.delete("all")
-        self.status_indicator.create_oval(2, 2, 10, 10, fill=color, outline=color)
+        # Recolour the existing indicator dot instead of recreating it
+        self.status_indicator.itemconfig(self._status_dot, fill=color, outline=color)
         
         # Update label
         self.status_label.configure(text=message)
@@ -1431,6 +1496,7 @@ class InteractiveChart(ttk.Frame):
         self.data_points: List[Tuple[float, float]] = []
         self.labels: List[str] = []
         self.title = ""
+        self._x_sorted = True
         
         # Interaction state
         self.zoom_factor = 1.0
@@ -1462,8 +1528,10 @@ class InteractiveChart(ttk.Frame):
         self.canvas.bind("<MouseWheel>", self.on_scroll)
         self.canvas.bind("<Motion>", self.on_hover)
         
-        # Tooltip for hover
+        # Tooltip for hover (built once, then shown/hidden)
         self.tooltip = None
+        self._tooltip_label = None
+        self._tooltip_index = None
     
     def plot_data(self, x_values: List[float], y_values: List[float], 
                   title: str = "", labels: List[str] = None):
@@ -1473,7 +1541,10 @@ class InteractiveChart(ttk.Frame):
         
         self.data_points = list(zip(x_values, y_values))
         self.labels = labels or [f"Point {i+1}" for i in range(len(x_values))]
+        # Sorted x lets redraw binary-search the visible slice when zoomed/panned
+        self._x_sorted = all(a <= b for a, b in zip(x_values, x_values[1:]))
         self.title = title
+        self.hide_tooltip()
         
         self.redraw()
     
@@ -1496,25 +1567,29 @@ class InteractiveChart(ttk.Frame):
         x_min, x_max = min(x_values), max(x_values)
         y_min, y_max = min(y_values), max(y_values)
         
-        x_range = x_max - x_min if x_max != x_min else 1
-        y_range = y_max - y_min if y_max != y_min else 1
+        # Grid, axes and title don't move with zoom/pan: draw them once here
+        self.draw_grid(padding, chart_area_width, chart_area_height)
+        self.draw_axes(padding, chart_area_width, chart_area_height, x_min, x_max, y_min, y_max)
         
-        # Apply zoom and pan
-        effective_width = chart_area_width * self.zoom_factor
-        effective_height = chart_area_height * self.zoom_factor
+        if self.title:
+            self.canvas.create_text(
+                self.chart_width // 2, 20,
+                text=self.title,
+                font=("TkDefaultFont", 12, "bold"),
+                fill="#374151",
+                tags="title"
+            )
         
-        # Convert data points to canvas coordinates
-        canvas_points = []
-        for x, y in self.data_points:
-            canvas_x = padding + ((x - x_min) / x_range) * effective_width + self.pan_x
-            canvas_y = self.chart_height - padding - ((y - y_min) / y_range) * effective_height + self.pan_y
-            canvas_points.append((canvas_x, canvas_y))
+        self.redraw_data()
+    
+    def redraw_data(self):
+        """Redraw only the data line and points (used while panning/zooming)"""
+        self.canvas.delete("data")
         
-        # Draw grid
-        self.draw_grid(padding, chart_area_width, chart_area_height)
+        if not self.data_points:
+            return
         
-        # Draw axes
-        self.draw_axes(padding, chart_area_width, chart_area_height, x_min, x_max, y_min, y_max)
+        canvas_points = self.get_canvas_points()
         
         # Draw data line
         if len(canvas_points) > 1:
@@ -1527,27 +1602,26 @@ class InteractiveChart(ttk.Frame):
                 fill="#3b82f6",
                 width=2,
                 smooth=True,
-                tags="data_line"
+                tags=("data", "data_line")
             )
         
-        # Draw data points
-        for i, (x, y) in enumerate(canvas_points):
+        # Draw data points, skipping those panned/zoomed off the canvas
+        lo, hi = 0, len(canvas_points)
+        if self._x_sorted:
+            xs = [p[0] for p in canvas_points]
+            lo = bisect_left(xs, -3)
+            hi = bisect_right(xs, self.chart_width + 3)
+        for i in range(lo, hi):
+            x, y = canvas_points[i]
             self.canvas.create_oval(
                 x - 3, y - 3, x + 3, y + 3,
                 fill="#3b82f6",
                 outline="white",
                 width=1,
-                tags=f"data_point_{i}"
+                tags=("data", f"data_point_{i}")
             )
         
-        # Draw title
-        if self.title:
-            self.canvas.create_text(
-                self.chart_width // 2, 20,
-                text=self.title,
-                font=("TkDefaultFont", 12, "bold"),
-                fill="#374151"
-            )
+        self.canvas.tag_raise("title")
     
     def draw_grid(self, padding: int, width: int, height: int):
         """Draw chart grid"""
@@ -1630,7 +1704,7 @@ class InteractiveChart(ttk.Frame):
             self.last_mouse_x = event.x
             self.last_mouse_y = event.y
             
-            self.redraw()
+            self.redraw_data()
     
     def on_release(self, event):
         """Handle mouse release"""
@@ -1644,17 +1718,20 @@ class InteractiveChart(ttk.Frame):
         
         if new_zoom != self.zoom_factor:
             self.zoom_factor = new_zoom
-            self.redraw()
+            self.redraw_data()
     
     def on_hover(self, event):
         """Handle mouse hover for tooltips"""
         # Find nearest data point
         closest_point = None
-        min_distance = float('inf')
+        min_distance = 20 * 20  # 20px threshold, compared squared
+        ex, ey = event.x, event.y
         
         for i, (x, y) in enumerate(self.get_canvas_points()):
-            distance = math.sqrt((event.x - x)**2 + (event.y - y)**2)
-            if distance < min_distance and distance < 20:  # 20px threshold
+            dx = ex - x
+            dy = ey - y
+            distance = dx * dx + dy * dy
+            if distance < min_distance:
                 min_distance = distance
                 closest_point = i
         
@@ -1684,44 +1761,49 @@ class InteractiveChart(ttk.Frame):
         effective_width = chart_area_width * self.zoom_factor
         effective_height = chart_area_height * self.zoom_factor
         
-        canvas_points = []
-        for x, y in self.data_points:
-            canvas_x = padding + ((x - x_min) / x_range) * effective_width + self.pan_x
-            canvas_y = self.chart_height - padding - ((y - y_min) / y_range) * effective_height + self.pan_y
-            canvas_points.append((canvas_x, canvas_y))
+        # Hoist per-point constants out of the loop
+        x_scale = effective_width / x_range
+        y_scale = effective_height / y_range
+        x_base = padding + self.pan_x
+        y_base = self.chart_height - padding + self.pan_y
         
-        return canvas_points
+        return [
+            (x_base + (x - x_min) * x_scale, y_base - (y - y_min) * y_scale)
+            for x, y in self.data_points
+        ]
     
     def show_tooltip(self, x: int, y: int, point_index: int):
         """Show tooltip for data point"""
-        if self.tooltip:
-            self.tooltip.destroy()
-        
-        data_x, data_y = self.data_points[point_index]
-        label = self.labels[point_index] if point_index < len(self.labels) else f"Point {point_index + 1}"
+        if self.tooltip is None:
+            self.tooltip = tk.Toplevel(self.canvas)
+            self.tooltip.withdraw()
+            self.tooltip.wm_overrideredirect(True)
+            self._tooltip_label = tk.Label(
+                self.tooltip,
+                background="lightyellow",
+                relief="solid",
+                borderwidth=1,
+                font=("TkDefaultFont", 8),
+                padx=4,
+                pady=2
+            )
+            self._tooltip_label.pack()
         
-        tooltip_text = f"{label}\nX: {data_x:.1f}\nY: {data_y:.1f}"
+        # Motion events fire per pixel; only rebuild the text when the point changes
+        if point_index != self._tooltip_index:
+            data_x, data_y = self.data_points[point_index]
+            label = self.labels[point_index] if point_index < len(self.labels) else f"Point {point_index + 1}"
+            self._tooltip_label.configure(text=f"{label}\nX: {data_x:.1f}\nY: {data_y:.1f}")
+            self._tooltip_index = point_index
         
-        self.tooltip = tk.Toplevel(self.canvas)
-        self.tooltip.wm_overrideredirect(True)
         self.tooltip.wm_geometry(f"+{x + self.winfo_rootx() + 10}+{y + self.winfo_rooty() + 10}")
-        
-        tk.Label(
-            self.tooltip,
-            text=tooltip_text,
-            background="lightyellow",
-            relief="solid",
-            borderwidth=1,
-            font=("TkDefaultFont", 8),
-            padx=4,
-            pady=2
-        ).pack()
+        self.tooltip.deiconify()
     
     def hide_tooltip(self):
         """Hide tooltip"""
-        if self.tooltip:
-            self.tooltip.destroy()
-            self.tooltip = None
+        if self.tooltip is not None and self._tooltip_index is not None:
+            self.tooltip.withdraw()
+            self._tooltip_index = None
     
     def reset_view(self):
         """Reset zoom and pan to default"""
@@ -1803,7 +1885,8 @@ def setup_auto_refresh(root: tk.Widget, callbacks: Dict[str, Dict[str, Any]]) ->
             config['callback'],
             config.get('interval', 60),
             config.get('priority', 'normal'),
-            config.get('condition')
+            config.get('condition'),
+            config.get('skip_when_hidden', False)
         )
     
     return manager
@@ -1923,14 +2006,7 @@ def create_info_panel(parent: tk.Widget, title: str, content: str,
         panel_type: 'info', 'success', 'warning', 'error'
         collapsible: Whether the panel can be collapsed
     """
-    colors = {
-        "info": {"bg": "#eff6ff", "border": "#3b82f6", "fg": "#1e40af"},
-        "success": {"bg": "#f0fdf4", "border": "#10b981", "fg": "#065f46"},
-        "warning": {"bg": "#fffbeb", "border": "#f59e0b", "fg": "#92400e"},
-        "error": {"bg": "#fef2f2", "border": "#ef4444", "fg": "#991b1b"}
-    }
-    
-    color_scheme = colors.get(panel_type, colors["info"])
+    color_scheme = _PANEL_COLORS.get(panel_type, _PANEL_COLORS["info"])
     
     # Main frame
     panel_frame = tk.Frame(
@@ -1946,12 +2022,9 @@ def create_info_panel(parent: tk.Widget, title: str, content: str,
     header_frame = tk.Frame(panel_frame, bg=color_scheme["bg"])
     header_frame.pack(fill="x", padx=8, pady=(8, 4))
     
-    # Icons for different panel types
-    icons = {"info": "ℹ️", "success": "✅", "warning": "⚠️", "error": "❌"}
-    
     tk.Label(
         header_frame,
-        text=icons.get(panel_type, "ℹ️"),
+        text=_TOAST_ICONS.get(panel_type, "ℹ️"),
         bg=color_scheme["bg"],
         font=("TkDefaultFont", 12)
     ).pack(side="left")
@@ -4,6 +4,7 @@ from tkinter import font as tkfont
 from typing import Optional, List
 import datetime as _dt
 import json
+import logging
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from .utils import load_config, today_iso
 from .ui_enhancements import (
@@ -30,6 +31,9 @@ from .gamification import GamificationEngine, GamificationWidget, setup_gamifica
 from .adaptive_theme import AdaptiveThemeManager, ThemeControlWidget, setup_adaptive_theme_styles
 
 
+logger = logging.getLogger(__name__)
+
+
 def steps_on_date(db_path: str, user_name: str, date_str: str) -> Optional[int]:
     """Get steps for a specific user and date"""
     try:
@@ -45,6 +49,32 @@ def steps_on_date(db_path: str, user_name: str, date_str: str) -> Optional[int]:
         return None
 
 
+def _trend_dates(days: int) -> List[str]:
+    """ISO dates for the last `days` days, oldest first"""
+    today = _dt.date.today()
+    return [(today - _dt.timedelta(days=offset)).isoformat() for offset in range(days - 1, -1, -1)]
+
+
+_TREND_COLUMNS = ("steps", "calories", "sleep_hours")
+
+
+def _activity_trend(db_path: str, user_name: str, column: str, days: int) -> List[float]:
+    """Daily values of an activities column for the last `days` days, fetched in one query"""
+    if column not in _TREND_COLUMNS:
+        raise ValueError(f"Unsupported trend column: {column}")
+    dates = _trend_dates(days)
+    if not dates:
+        return []
+    with get_conn(db_path) as c:
+        cur = c.cursor()
+        cur.execute(
+            f'''SELECT a.date, a.{column} FROM activities a JOIN users u ON a.user_id=u.id
+               WHERE u.name=? AND a.date BETWEEN ? AND ?''', (user_name, dates[0], dates[-1])
+        )
+        by_date = dict(cur.fetchall())
+    return [float(by_date.get(date_str) or 0) for date_str in dates]
+
+
 def _default_profile(name: str):
     return (None, name, 30, "M", 166, 66, "light", "", "")
 
@@ -79,7 +109,7 @@ def dashboard_text(db, user):
         tmax, tmin, hum, wind, cond_code, city = wrow
         # Use weather display with emoji - with error handling
         try:
-            weather_display = wz.get_weather_display(cond_code) if hasattr(wz, 'get_weather_display') else f"🌡️ {wz.code_to_text(cond_code)}"
+            weather_display = wz.get_weather_display(cond_code)
         except Exception:
             weather_display = f"🌡️ {cond_code}"  # Fallback to just showing the code/text
         lines.append(f"🌤️ Today's weather [{city}]: 🌡️ max {tmax}°C, min {tmin}°C, 💧 humidity {hum}%, 💨 wind {wind} km/h, {weather_display}")
@@ -562,8 +592,7 @@ def main(config_path: Optional[str] = None):
             weight_kg = u[5] if u[5] else 70  # Default weight
             
             trend_data = []
-            for i in range(days):
-                date_str = (_dt.date.today() - _dt.timedelta(days=days-1-i)).isoformat()
+            for date_str in _trend_dates(days):
                 goal = daily_water_goal_ml(weight_kg, date_str, db_path, user_name)
                 actual = daily_water_total(db_path, user_name, date_str)
                 pct = (actual / goal * 100) if goal > 0 else 0
@@ -576,61 +605,32 @@ def main(config_path: Optional[str] = None):
     def get_sleep_trend(db_path: str, user_name: str, days: int = 7) -> List[float]:
         """Get sleep hours trend for the last N days"""
         try:
-            trend_data = []
-            for i in range(days):
-                date_str = (_dt.date.today() - _dt.timedelta(days=days-1-i)).isoformat()
-                sleep_hours = sleep_on_date(db_path, user_name, date_str) or 0
-                trend_data.append(sleep_hours)
-            
-            return trend_data
+            return _activity_trend(db_path, user_name, "sleep_hours", days)
         except:
             return [0] * days
     
     def get_health_trend(db_path: str, user_name: str, weight_kg: float, height_cm: float, days: int = 7) -> List[float]:
         """Get health score trend for the last N days"""
         try:
-            trend_data = []
-            for i in range(days):
-                # Calculate health score for each day looking back 7 days from that point
-                end_date = _dt.date.today() - _dt.timedelta(days=days-1-i)
-                hs = health_score(db_path, user_name, weight_kg, height_cm, days=7)
-                score = hs.get('score', 0) if isinstance(hs, dict) else 0
-                trend_data.append(score)
-            
-            return trend_data
+            # health_score always looks back 7 days from today, so every day of the
+            # trend gets the same score; compute it once
+            hs = health_score(db_path, user_name, weight_kg, height_cm, days=7)
+            score = hs.get('score', 0) if isinstance(hs, dict) else 0
+            return [score] * days
         except:
             return [0] * days
     
     def get_steps_trend(db_path: str, user_name: str, days: int = 7) -> List[float]:
         """Get daily steps trend for the last N days"""
         try:
-            trend_data = []
-            for i in range(days):
-                date_str = (_dt.date.today() - _dt.timedelta(days=days-1-i)).isoformat()
-                steps = steps_on_date(db_path, user_name, date_str) or 0
-                trend_data.append(float(steps))
-            
-            return trend_data
+            return _activity_trend(db_path, user_name, "steps", days)
         except:
             return [0] * days
     
     def get_calories_trend(db_path: str, user_name: str, days: int = 7) -> List[float]:
         """Get daily calories trend for the last N days"""
         try:
-            with get_conn(db_path) as c:
-                cur = c.cursor()
-                trend_data = []
-                for i in range(days):
-                    date_str = (_dt.date.today() - _dt.timedelta(days=days-1-i)).isoformat()
-                    cur.execute(
-                        '''SELECT calories FROM activities a JOIN users u ON a.user_id=u.id
-                           WHERE u.name=? AND a.date=?''', (user_name, date_str)
-                    )
-                    result = cur.fetchone()
-                    calories = result[0] if result and result[0] else 0
-                    trend_data.append(float(calories))
-                
-                return trend_data
+            return _activity_trend(db_path, user_name, "calories", days)
         except:
             return [0] * days
 
@@ -811,7 +811,7 @@ def main(config_path: Optional[str] = None):
             tmax, tmin, hum, wind, cond_code, city_name = wrow
             # Convert condition code to emoji + text - with error handling
             try:
-                weather_display = wz.get_weather_display(cond_code) if hasattr(wz, 'get_weather_display') else f"🌡️ {wz.code_to_text(cond_code)}"
+                weather_display = wz.get_weather_display(cond_code)
             except Exception:
                 weather_display = f"🌡️ {cond_code}"  # Fallback
             weather_tip_var.set(
@@ -1974,7 +1974,7 @@ Are you absolutely sure you want to reset the application?"""
             gamification_widget.update_display()
             
         except Exception as e:
-            print(f"Error updating gamification: {e}")
+            logger.warning("Error updating gamification: %s", e)
     
     # Start adaptive theme checking
     adaptive_theme_manager.start_auto_checking(root)
@@ -2075,7 +2075,8 @@ Are you absolutely sure you want to reset the application?"""
         'insights': {
             'callback': generate_insights,
             'interval': 300,  # Refresh every 5 minutes
-            'priority': 'low'
+            'priority': 'low',
+            'skip_when_hidden': True  # Only redraws the insights text
         }
     }
     
@@ -2085,7 +2086,8 @@ Are you absolutely sure you want to reset the application?"""
             name,
             config['callback'],
             config['interval'],
-            config['priority']
+            config['priority'],
+            skip_when_hidden=config.get('skip_when_hidden', False)
         )
     
     # Start auto-refresh
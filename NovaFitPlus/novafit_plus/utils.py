@@ -1,23 +1,40 @@
 import os, json, datetime as _dt
 from pathlib import Path
 from importlib import resources
-from typing import Optional, Union
+from typing import Dict, Optional, Tuple, Union
 
 
 _CONFIG_RESOURCE = "config.json"
 _ENV_CONFIG = "NOVAFIT_CONFIG"
+_BUNDLED_CONFIG = resources.files(__package__) / _CONFIG_RESOURCE
 
 
 PathLike = Union[str, os.PathLike]
 
+# Parsed configs keyed by path -> ((mtime_ns, size), data); re-read only on change
+_CONFIG_CACHE: Dict[str, Tuple[Tuple[int, int], dict]] = {}
+
+
+def _read_json_cached(path: Path) -> Optional[dict]:
+    st = path.stat()
+    stamp = (st.st_mtime_ns, st.st_size)
+    key = str(path)
+    hit = _CONFIG_CACHE.get(key)
+    if hit is None or hit[0] != stamp:
+        with path.open("r", encoding="utf-8") as f:
+            hit = (stamp, json.load(f))
+        _CONFIG_CACHE[key] = hit
+    data = hit[1]
+    # Copy so callers can mutate the result; a non-object root is not a usable config
+    return dict(data) if isinstance(data, dict) else None
+
 
 def _try_path(candidate: Optional[PathLike]) -> Optional[dict]:
     if not candidate:
         return None
     path = Path(candidate).expanduser()
     if path.is_file():
-        with path.open("r", encoding="utf-8") as f:
-            return json.load(f)
+        return _read_json_cached(path)
     return None
 
 
@@ -30,11 +47,11 @@ def load_config(path: Optional[PathLike] = None) -> dict:
     if cfg is not None:
         return cfg
 
-    package_files = resources.files(__package__)
-    resource_path = package_files / _CONFIG_RESOURCE
-    if not resource_path.is_file():
+    if not _BUNDLED_CONFIG.is_file():
         raise FileNotFoundError("Bundled configuration missing from package")
-    with resource_path.open("r", encoding="utf-8") as f:
+    if isinstance(_BUNDLED_CONFIG, Path):
+        return _read_json_cached(_BUNDLED_CONFIG)
+    with _BUNDLED_CONFIG.open("r", encoding="utf-8") as f:
         return json.load(f)
 
 def today_iso():
@@ -45,9 +62,7 @@ def clamp(n, lo, hi):
 
 def print_box(title: str):
     line = "═" * (len(title) + 2)
-    print(f"╔{line}╗")
-    print(f"║ {title} ║")
-    print(f"╚{line}╝")
+    print(f"╔{line}╗\n║ {title} ║\n╚{line}╝")
 
 def ascii_bar(current: float, goal: float, width: int = 24) -> str:
     if goal <= 0:
@@ -54,6 +54,21 @@ WEATHER_EMOJIS = {
     99: "⛈️"   # Severe thunderstorm
 }
 
+# Stored condition text (from code_to_text) mapped to emojis
+WEATHER_TEXT_EMOJIS = {
+    'clear sky': "☀️",
+    'mostly clear': "🌤️",
+    'partly cloudy': "⛅",
+    'overcast': "☁️",
+    'fog': "🌫️",
+    'light rain': "🌦️",
+    'rain': "🌧️",
+    'heavy rain': "⛈️",
+    'light snow': "🌨️",
+    'snow': "❄️",
+    'thunderstorm': "⛈️"
+}
+
 def code_to_text(code) -> str:
     """Convert weather code to text description"""
     try:
@@ -75,21 +90,7 @@ def code_to_emoji(code) -> str:
     except (ValueError, TypeError):
         # If it's a text description, try to match it
         if isinstance(code, str):
-            # Map common text descriptions to emojis
-            text_to_emoji = {
-                'clear sky': "☀️",
-                'mostly clear': "🌤️",
-                'partly cloudy': "⛅",
-                'overcast': "☁️",
-                'fog': "🌫️",
-                'light rain': "🌦️",
-                'rain': "🌧️",
-                'heavy rain': "⛈️",
-                'light snow': "🌨️",
-                'snow': "❄️",
-                'thunderstorm': "⛈️"
-            }
-            return text_to_emoji.get(code.lower(), "🌡️")
+            return WEATHER_TEXT_EMOJIS.get(code.lower(), "🌡️")
         return "🌡️"
 
 def get_weather_display(code) -> str: